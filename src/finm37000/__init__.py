@@ -7,6 +7,8 @@ from .agg import (
 from .constant_maturity import (
     constant_maturity_splice as constant_maturity_splice,
     get_roll_spec as get_roll_spec,
+    get_roll_spec_records as get_roll_spec_records,
+    roll_spec_dtype as roll_spec_dtype,
 )
 from .continuous import (
     additive_splice as additive_splice,
@@ -1,33 +1,25 @@
 """Calculate constant maturity roll specifications and weighted values."""
 
 import datetime
-import sys
-from dataclasses import dataclass
-from typing import Union
+import functools
+from typing import Optional, Union, cast
 from zoneinfo import ZoneInfo
 
+import numpy as np
 import pandas as pd
+from pandas.api.extensions import ExtensionArray
 
-
-@dataclass
-class ConstantMaturitySpec:
-    """The constant maturity roll specification."""
-
-    d0: datetime.date
-    d1: datetime.date
-    pre_id: int
-    next_id: int
-
-    def to_json(self) -> dict[str, str]:
-        """Convert to JSON."""
-        return {
-            "d0": self.d0.strftime("%Y-%m-%d"),
-            "d1": self.d1.strftime("%Y-%m-%d"),
-            "p": str(self.pre_id),
-            "n": str(self.next_id),
-        }
+roll_spec_dtype = np.dtype(
+    [
+        ("d0", "datetime64[D]"),
+        ("d1", "datetime64[D]"),
+        ("p", np.int64),
+        ("n", np.int64),
+    ]
+)
 
 
+@functools.lru_cache(maxsize=None)
 def _extract_maturity_days(symbol: str) -> datetime.timedelta:
     product, roll_type, maturity_str = symbol.split(".")
     maturity_days = datetime.timedelta(days=int(maturity_str))
@@ -37,6 +29,186 @@ def _extract_maturity_days(symbol: str) -> datetime.timedelta:
     return maturity_days
 
 
+def _lexsort(keys: tuple[np.ndarray, ...]) -> np.ndarray:
+    """Return `np.lexsort(keys)`, skipping the sort when already in order."""
+    tied = np.ones(max(len(keys[0]) - 1, 0), dtype=bool)
+    ascending = np.zeros_like(tied)
+    for key in reversed(keys):
+        ascending |= tied & (key[:-1] < key[1:])
+        tied &= key[:-1] == key[1:]
+    if np.all(ascending | tied):
+        return np.arange(len(keys[0]))
+    return np.lexsort(keys)
+
+
+def _as_days(col: pd.Series) -> np.ndarray:
+    """Convert datetimes to `datetime64[D]` holding their local calendar dates."""
+    tz = col.dt.tz
+    if tz is None:
+        return col.to_numpy(dtype="datetime64[D]")
+    offset = tz.utcoffset(None)
+    if offset is not None:
+        # Fixed offsets like Databento's UTC shift the values without pandas.
+        local = col.to_numpy(dtype="datetime64[ns]") + np.timedelta64(offset)
+        return local.astype("datetime64[D]")
+    col = col.dt.tz_localize(None)
+    return col.to_numpy(dtype="datetime64[D]")
+
+
+def _first_listings(
+    iids: np.ndarray,
+    exp_times: np.ndarray,
+    exp_days: np.ndarray,
+    recv_days: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Order contracts by expiration and collapse re-sent definitions.
+
+    Definitions are re-sent every session, so most rows repeat a contract that
+    is already live and would only add receive epochs to search. Neighbouring
+    rows of the same contract and expiration time pick the same pairs, so they
+    are kept once, live from their earliest receipt.
+    """
+    by_time = np.arange(len(iids))
+    if not np.all(exp_times[1:] >= exp_times[:-1]):
+        by_time = np.argsort(exp_times)
+    iids, exp_times = iids[by_time], exp_times[by_time]
+    first = np.ones(len(by_time), dtype=bool)
+    first[1:] = (iids[1:] != iids[:-1]) | (exp_times[1:] != exp_times[:-1])
+    starts = np.flatnonzero(first)
+    recv_days = recv_days[by_time]
+    if len(starts):
+        recv_days = np.fmin.reduceat(recv_days, starts)
+    return iids[starts], exp_days[by_time][starts], recv_days
+
+
+def _pick_pairs(
+    days: np.ndarray,
+    exp_days: np.ndarray,
+    recv_days: np.ndarray,
+    maturity: np.timedelta64,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Find the pre and next contract positions for every day at once.
+
+    Contracts must be sorted by expiration. A contract is live from its receive
+    date through its expiration date. The pre contract is the last live one
+    expiring before `day + maturity` and the next contract is the first live
+    one expiring on or after it. Days without such a contract get -1.
+    """
+    targets = days + maturity
+    pre_pos = np.full(len(days), -1, dtype=np.intp)
+    next_pos = np.full(len(days), -1, dtype=np.intp)
+    # Contracts only become live on receive dates, so the days between two
+    # consecutive receive dates share one live set and can be searched together.
+    # The live set only grows, so admit contracts by their first live epoch
+    # instead of rescanning every receive date for each epoch.
+    epochs, first_live = np.unique(recv_days, return_inverse=True)
+    by_epoch = np.argsort(first_live, kind="stable")
+    n_live = np.searchsorted(first_live[by_epoch], np.arange(len(epochs)), "right")
+    is_live = np.zeros(len(recv_days), dtype=bool)
+    admitted = 0
+    bounds = np.append(np.searchsorted(days, epochs), len(days))
+    for count, lo, hi in zip(n_live, bounds[:-1], bounds[1:]):
+        if lo == hi:
+            continue
+        is_live[by_epoch[admitted:count]] = True
+        admitted = count
+        live = np.flatnonzero(is_live)
+        live_exp = exp_days[live]
+        split = np.searchsorted(live_exp, targets[lo:hi], side="left")
+        unexpired = np.searchsorted(live_exp, days[lo:hi], side="left")
+        pre_pos[lo:hi] = np.where(split > unexpired, live[split - 1], -1)
+        has_next = split < len(live)
+        next_pos[lo:hi] = np.where(has_next, live[np.minimum(split, len(live) - 1)], -1)
+    return pre_pos, next_pos
+
+
+def _run_length_records(
+    days: np.ndarray,
+    pre_ids: np.ndarray,
+    next_ids: np.ndarray,
+) -> np.ndarray:
+    """Collapse consecutive days with the same pair into roll spec records.
+
+    Each segment ends where the next begins, except the last, which ends on the
+    final day and is dropped if it would be empty.
+    """
+    if len(days) == 0:
+        return np.empty(0, dtype=roll_spec_dtype)
+    changed = (pre_ids[1:] != pre_ids[:-1]) | (next_ids[1:] != next_ids[:-1])
+    starts = np.append(0, np.flatnonzero(changed) + 1)
+    records = np.empty(len(starts), dtype=roll_spec_dtype)
+    records["d0"] = days[starts]
+    records["d1"] = np.append(days[starts[1:]], days[-1])
+    records["p"] = pre_ids[starts]
+    records["n"] = next_ids[starts]
+    if records["d0"][-1] == records["d1"][-1]:
+        records = records[:-1]
+    return records
+
+
+def get_roll_spec_records(
+    symbol: str,
+    instrument_defs: pd.DataFrame,
+    start: datetime.date,
+    end: datetime.date,
+) -> np.ndarray:
+    """Compute the constant maturity roll specification as a structured array.
+
+    Args:
+        symbol: The name of the continuous contract using the form
+                `f"{product}.cm.{dtm}"` where product is the common
+                symbol like `CL` and `dtm` is the days to maturity.
+        instrument_defs: DataFrame with the instrument specifications
+                         `ts_recv`, `instrument_class`, `instrument_id`, `raw_symbol,
+                          and `expiration`. Per Databento standards, `ts_recv` and
+                          `expiration` are in UTC.
+        start: The start date of the roll spec.
+        end: The end date of the roll spec.
+
+    Returns:
+        A numpy array of `roll_spec_dtype` with one row per segment holding
+        the first date `d0`, one past the last date `d1`, and the instrument
+        ids `p` and `n` of the pre and next contracts. This is the typed form
+        of `get_roll_spec` and needs no string parsing to consume.
+
+    """
+    days = np.arange(
+        np.datetime64(start, "D"),
+        np.datetime64(end, "D") + np.timedelta64(1, "D"),
+    )
+    maturity_days = _extract_maturity_days(symbol)
+    legs = np.flatnonzero((instrument_defs["instrument_class"] == "F").to_numpy())
+    key_cols = ["ts_recv", "instrument_id", "raw_symbol"]
+    is_dup = instrument_defs[key_cols].take(legs).duplicated().to_numpy()
+    # Take only the columns still needed, once each, rather than copying
+    # the leg subset of the frame.
+    rows = legs[~is_dup]
+    exp_times = (
+        instrument_defs["expiration"].iloc[rows].to_numpy(dtype="datetime64[ns]")
+    )
+    # A contract without an expiration never straddles a date, so drop it
+    # before NaT sorts after every real expiration.
+    has_exp = ~np.isnat(exp_times)
+    rows, exp_times = rows[has_exp], exp_times[has_exp]
+    expiration = instrument_defs["expiration"].iloc[rows]
+    iids, exp_days, recv_days = _first_listings(
+        instrument_defs["instrument_id"].to_numpy()[rows],
+        exp_times,
+        _as_days(expiration),
+        _as_days(instrument_defs["ts_recv"].iloc[rows]),
+    )
+    maturity = np.timedelta64(maturity_days.days, "D")
+    pre_pos, next_pos = _pick_pairs(days, exp_days, recv_days, maturity)
+    missing = (pre_pos < 0) | (next_pos < 0)
+    if missing.any():
+        first = int(np.argmax(missing))
+        side = "<" if pre_pos[first] < 0 else ">="
+        day = pd.Timestamp(days[first]).tz_localize(ZoneInfo("UTC"))
+        msg = f"No futures with maturity {side} {maturity_days} on {day}."
+        raise ValueError(msg)
+    return _run_length_records(days, iids[pre_pos], iids[next_pos])
+
+
 def get_roll_spec(
     symbol: str,
     instrument_defs: pd.DataFrame,
@@ -65,98 +237,190 @@ def get_roll_spec(
         the adjusted data.
 
     """
-    utc = ZoneInfo("UTC")
-    dates = pd.date_range(start=start, end=end, tz=utc)
-    maturity_days = _extract_maturity_days(symbol)
-    required_cols = ["expiration", "ts_recv", "instrument_id", "raw_symbol"]
-    is_leg = instrument_defs["instrument_class"] == "F"
-    by_exp = instrument_defs[is_leg][required_cols]
-    by_exp = by_exp.set_index("expiration").drop_duplicates()
-    by_exp = by_exp.sort_index().reset_index()
-    cm: Union[ConstantMaturitySpec, None] = None
-    one_day = datetime.timedelta(days=1)
-    specs = []
-    for date in dates:
-        mask = (by_exp["ts_recv"].dt.date <= date.date()) & (
-            by_exp["expiration"].dt.date >= date.date()
-        )
-        available = by_exp[mask]
-        if sys.version_info <= (3, 9):
-            maturity = available["expiration"].dt.date - date.date()  # type: ignore
-        else:
-            maturity = available["expiration"].dt.date - date.date()
-        pre_df = available[maturity < maturity_days]["instrument_id"]
-        if len(pre_df) == 0:
-            msg = f"No futures with maturity < {maturity_days} on {date}."
-            raise ValueError(msg)
-        pre_id = pre_df.iloc[-1]
-        next_df = available[maturity >= maturity_days]["instrument_id"]
-        if len(next_df) == 0:
-            msg = f"No futures with maturity >= {maturity_days} on {date}."
-            raise ValueError(msg)
-        next_id = next_df.iloc[0]
-        available = available.copy()
-        available["maturity"] = maturity
-        if cm is None:
-            cm = ConstantMaturitySpec(
-                d0=date, d1=date + one_day, pre_id=pre_id, next_id=next_id
-            )
-        elif pre_id != cm.pre_id or next_id != cm.next_id:
-            specs.append(cm.to_json())
-            cm = ConstantMaturitySpec(
-                d0=date, d1=date + one_day, pre_id=pre_id, next_id=next_id
-            )
-        else:
-            cm.d1 += one_day
-    if cm is not None:
-        cm.d1 = dates[-1]
-        if cm.d0 != cm.d1:
-            specs.append(cm.to_json())
-    return specs
+    records = get_roll_spec_records(symbol, instrument_defs, start, end)
+    columns = (
+        np.datetime_as_string(records["d0"]),
+        np.datetime_as_string(records["d1"]),
+        records["p"].astype(str),
+        records["n"].astype(str),
+    )
+    return [
+        {"d0": d0, "d1": d1, "p": p, "n": n}
+        for d0, d1, p, n in zip(*(col.tolist() for col in columns))
+    ]
+
+
+def _index_instruments(
+    ids: np.ndarray,
+    dates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Order rows by instrument and date and locate each instrument's block.
+
+    Returns the row order, the sorted distinct ids and the offsets `indptr`
+    such that block `b` spans sorted rows `indptr[b]:indptr[b + 1]`.
+    """
+    order = _lexsort((dates, ids))
+    ids = ids[order]
+    is_first = np.ones(len(ids), dtype=bool)
+    is_first[1:] = ids[1:] != ids[:-1]
+    indptr = np.append(np.flatnonzero(is_first), len(ids))
+    return order, ids[indptr[:-1]], indptr
+
+
+def _find_blocks(block_ids: np.ndarray, ids: np.ndarray) -> np.ndarray:
+    """Locate the block of every id in `ids`, raising KeyError for unknown ids."""
+    blocks = np.searchsorted(block_ids, ids)
+    known = blocks < len(block_ids)
+    known[known] = block_ids[blocks[known]] == ids[known]
+    if not known.all():
+        raise KeyError(int(ids[np.argmin(known)]))
+    return blocks
+
+
+def _slice_dates(
+    dates: np.ndarray,
+    indptr: np.ndarray,
+    block: int,
+    d0: np.datetime64,
+    d1: np.datetime64,
+) -> slice:
+    """Locate the rows in `[d0, d1)` within one instrument's sorted block."""
+    start, stop = indptr[block], indptr[block + 1]
+    lo, hi = np.searchsorted(dates[start:stop], np.array([d0, d1]), side="left")
+    return slice(int(start + lo), int(start + hi))
+
+
+def _localize_bounds(
+    dates: Union[list[str], np.ndarray],
+    tz: Optional[datetime.tzinfo],
+) -> np.ndarray:
+    """Parse roll dates in `tz` as UTC `datetime64[ns]` in a single pass."""
+    if isinstance(dates, np.ndarray):
+        wall = dates.astype("datetime64[ns]")
+    else:
+        wall = pd.DatetimeIndex(dates).to_numpy(dtype="datetime64[ns]")
+    offset = None if tz is None else tz.utcoffset(None)
+    if tz is None or offset is not None:
+        # Naive and fixed-offset dates need no calendar lookups to localize.
+        return wall - np.timedelta64(offset or datetime.timedelta(0))
+    localized = pd.DatetimeIndex(wall).tz_localize(tz)
+    return localized.to_numpy(dtype="datetime64[ns]")
+
+
+def _check_unique(
+    repeats: np.ndarray,
+    rows: slice,
+    date_col: str,
+    instrument_id: int,
+) -> None:
+    """Raise if `rows` repeat a date, using the running count of repeats."""
+    if rows.stop - rows.start > 1 and repeats[rows.stop - 1] > repeats[rows.start]:
+        msg = f"Instrument {instrument_id} has duplicate {date_col} values."
+        raise ValueError(msg)
+
+
+def _outer_align(
+    pre_dates: np.ndarray,
+    next_dates: np.ndarray,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Outer join two sorted date arrays into positions, -1 where missing."""
+    if np.array_equal(pre_dates, next_dates):
+        # Both legs usually trade on the same dates, so there is nothing to join.
+        pos = np.arange(len(pre_dates))
+        return pos, pos
+    # Merge the sorted legs in one pass instead of sorting their union: every
+    # next date lands after the pre dates below it and the earlier new dates.
+    at = np.searchsorted(pre_dates, next_dates, side="left")
+    shared = at < len(pre_dates)
+    shared[shared] = pre_dates[at[shared]] == next_dates[shared]
+    added = ~shared
+    next_idx = at + np.cumsum(added) - added
+    pre_range = np.arange(len(pre_dates))
+    pre_idx = pre_range + np.searchsorted(at[added], pre_range, side="right")
+    pre_pos = np.full(len(pre_dates) + int(added.sum()), -1, dtype=np.intp)
+    next_pos = pre_pos.copy()
+    pre_pos[pre_idx] = pre_range
+    next_pos[next_idx] = np.arange(len(next_dates))
+    return pre_pos, next_pos
+
+
+def _segment_rows(
+    positions: list[np.ndarray],
+    starts: list[int],
+    order: np.ndarray,
+) -> np.ndarray:
+    """Map per-segment block positions to rows of the unsorted frame, keeping -1.
+
+    Only the gathered columns are ever reordered this way, never the whole frame.
+    """
+    pos = np.concatenate(positions)
+    sorted_rows = pos + np.repeat(starts, [len(p) for p in positions])
+    return np.where(pos < 0, -1, order[sorted_rows])
+
+
+def _take(col: pd.Series, pos: np.ndarray) -> ExtensionArray:
+    """Gather `col` at `pos`, filling -1 with the missing value like a merge."""
+    return cast("ExtensionArray", col.array.take(pos, allow_fill=True))
 
 
 def _splice_pair(
-    roll_spec: list[dict[str, str]],
+    roll_spec: Union[list[dict[str, str]], np.ndarray],
     df: pd.DataFrame,
     date_col: str,
     price_col: str,
 ) -> pd.DataFrame:
-    grouped = df.groupby("instrument_id")
-    pieces = []
+    all_dates = df[date_col].to_numpy(dtype="datetime64[ns]")
+    order, block_ids, indptr = _index_instruments(
+        df["instrument_id"].to_numpy(), all_dates
+    )
+    all_dates = all_dates[order]
+    # Count repeated dates once so each segment checks its rows in O(1).
+    repeats = np.append(0, np.cumsum(all_dates[1:] == all_dates[:-1]))
+    pre_takes = []
+    next_takes = []
+    pre_starts = []
+    next_starts = []
     tz = df[date_col].dt.tz
-    for spec in roll_spec:
-        d0 = pd.Timestamp(spec["d0"], tz=tz)
-        d1 = pd.Timestamp(spec["d1"], tz=tz)
-        p = int(spec["p"])
-        n = int(spec["n"])
-        group_n = grouped.get_group(n)
-        group_p = grouped.get_group(p)
-        piece_n = group_n[(group_n[date_col] >= d0) & (group_n[date_col] < d1)].copy()
-        piece_p = group_p[(group_p[date_col] >= d0) & (group_p[date_col] < d1)].copy()
-        piece_p = piece_p.rename(
-            columns={
-                price_col: f"pre_{price_col}",
-                "instrument_id": "pre_id",
-                "expiration": "pre_expiration",
-            }
-        )
-        piece_n = piece_n.rename(
-            columns={
-                price_col: f"next_{price_col}",
-                "instrument_id": "next_id",
-                "expiration": "next_expiration",
-            }
-        )
-        pre_cols = [date_col, f"pre_{price_col}", "pre_id", "pre_expiration"]
-        next_cols = [date_col, f"next_{price_col}", "next_id", "next_expiration"]
-        piece = piece_p[pre_cols].merge(
-            piece_n[next_cols],
-            on=date_col,
-            how="outer",
-            validate="one_to_one",
-        )
-        pieces.append(piece)
-    return pd.concat(pieces, ignore_index=True)
+    if isinstance(roll_spec, np.ndarray):
+        d0s = _localize_bounds(roll_spec["d0"], tz)
+        d1s = _localize_bounds(roll_spec["d1"], tz)
+        ps = roll_spec["p"]
+        ns = roll_spec["n"]
+    else:
+        d0s = _localize_bounds([spec["d0"] for spec in roll_spec], tz)
+        d1s = _localize_bounds([spec["d1"] for spec in roll_spec], tz)
+        ps = np.array([int(spec["p"]) for spec in roll_spec], dtype=np.int64)
+        ns = np.array([int(spec["n"]) for spec in roll_spec], dtype=np.int64)
+    pre_blocks = _find_blocks(block_ids, ps)
+    next_blocks = _find_blocks(block_ids, ns)
+    segments = zip(ps.tolist(), ns.tolist(), pre_blocks.tolist(), next_blocks.tolist())
+    for (p, n, pre_block, next_block), d0, d1 in zip(segments, d0s, d1s):
+        pre_rows = _slice_dates(all_dates, indptr, pre_block, d0, d1)
+        next_rows = _slice_dates(all_dates, indptr, next_block, d0, d1)
+        _check_unique(repeats, pre_rows, date_col, p)
+        _check_unique(repeats, next_rows, date_col, n)
+        pre_pos, next_pos = _outer_align(all_dates[pre_rows], all_dates[next_rows])
+        pre_takes.append(pre_pos)
+        next_takes.append(next_pos)
+        pre_starts.append(pre_rows.start)
+        next_starts.append(next_rows.start)
+    # Gather every column once for all segments rather than per segment.
+    pre_take = _segment_rows(pre_takes, pre_starts, order)
+    pre_missing = pre_take < 0
+    next_take = _segment_rows(next_takes, next_starts, order)
+    dates = _take(df[date_col], pre_take)
+    dates[pre_missing] = df[date_col].array.take(next_take[pre_missing])
+    return pd.DataFrame(
+        {
+            date_col: dates,
+            f"pre_{price_col}": _take(df[price_col], pre_take),
+            "pre_id": _take(df["instrument_id"], pre_take),
+            "pre_expiration": _take(df["expiration"], pre_take),
+            f"next_{price_col}": _take(df[price_col], next_take),
+            "next_id": _take(df["instrument_id"], next_take),
+            "next_expiration": _take(df["expiration"], next_take),
+        }
+    )
 
 
 def calc_maturity_weight(
@@ -176,16 +440,25 @@ def calc_maturity_weight(
         A pandas Series containing the maturity weights.
 
     """
-    pre_exp = df["pre_expiration"]
-    next_exp = df["next_expiration"]
-    t = df[date_col]
-    weight = (next_exp - (t + maturity_days)) / (next_exp - pre_exp)
-    return weight
+    pre_exp = df["pre_expiration"].to_numpy(dtype="datetime64[ns]")
+    next_exp = df["next_expiration"].to_numpy(dtype="datetime64[ns]")
+    t = df[date_col].to_numpy(dtype="datetime64[ns]")
+    # Reuse the first difference in place rather than shifting every date.
+    remaining = next_exp - t
+    remaining -= np.timedelta64(maturity_days)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        weight = remaining / (next_exp - pre_exp)
+    return pd.Series(weight, index=df.index)
+
+
+def _is_numpy_numeric(col: pd.Series) -> bool:
+    """Return whether `col` is backed by a plain numpy numeric array."""
+    return isinstance(col.dtype, np.dtype) and col.dtype.kind in "iuf"
 
 
 def constant_maturity_splice(  # noqa: PLR0913
     symbol: str,
-    roll_spec: list[dict[str, str]],
+    roll_spec: Union[list[dict[str, str]], np.ndarray],
     all_data: pd.DataFrame,
     date_col: str,
     price_col: str,
@@ -200,7 +473,9 @@ def constant_maturity_splice(  # noqa: PLR0913
                    containing the first date, one past the last date, and
                    the instrument id of the instrument in the spliced contract. See
                    `databento.Historical.symbology.resolve()["results"]` for
-                   a dictionary with values of this type.
+                   a dictionary with values of this type. The structured
+                   array from `get_roll_spec_records` is also accepted and
+                   avoids parsing the strings.
         all_data: A pandas DataFrame containing the raw data to splice including
                   the `expiration` column.
         date_col: The name of the column in `df` that contains the date.
@@ -224,8 +499,17 @@ def constant_maturity_splice(  # noqa: PLR0913
     )
     pre_price = unadjusted_splice[f"pre_{price_col}"]
     next_price = unadjusted_splice[f"next_{price_col}"]
+    blended: Union[np.ndarray, pd.Series]
+    if _is_numpy_numeric(pre_price) and _is_numpy_numeric(next_price):
+        # next + w * (pre - next), blended in place in a single buffer.
+        next_values = next_price.to_numpy(dtype=np.float64)
+        blended = pre_price.to_numpy(dtype=np.float64) - next_values
+        blended *= maturity_weight.to_numpy()
+        blended += next_values
+    else:
+        # Nullable and other extension dtypes keep the result dtype of their
+        # own arithmetic, e.g. `Float64` with `pd.NA`.
+        blended = next_price + maturity_weight * (pre_price - next_price)
     unadjusted_splice["pre_weight"] = maturity_weight
-    unadjusted_splice[symbol] = (
-        maturity_weight * pre_price + (1 - maturity_weight) * next_price
-    )
+    unadjusted_splice[symbol] = blended
     return unadjusted_splice
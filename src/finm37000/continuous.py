@@ -1,86 +1,72 @@
 """Functions to splice and adjust futures data into continuous data."""
 
-from typing import Optional
+import operator
+from datetime import tzinfo
+from typing import Any, Callable, Optional
 
+import numpy as np
 import pandas as pd
 
-
-def _splice_unadjusted(
-    roll_spec: list[dict[str, str]],
-    df: pd.DataFrame,
-    date_col: str,
-) -> pd.DataFrame:
-    grouped = df.groupby("instrument_id")
-    pieces = []
-    tz = df[date_col].dt.tz
-    for spec in roll_spec:
-        d0 = pd.Timestamp(spec["d0"], tz=tz)
-        d1 = pd.Timestamp(spec["d1"], tz=tz)
-        s = int(spec["s"])
-        group = grouped.get_group(s)
-        piece = group[(group[date_col] >= d0) & (group[date_col] < d1)].copy()
-        pieces.append(piece)
-    return pd.concat(pieces, ignore_index=True)
+from .constant_maturity import _find_blocks, _index_instruments, _slice_dates
 
 
-def _calc_additive_adjustment(
+def _parse_segments(
     roll_spec: list[dict[str, str]],
-    df: pd.DataFrame,
-    date_col: str,
-    adjust_by: str,
-) -> pd.Series:
-    tz = df[date_col].dt.tz
-    last_date = None
-    last_true_value = None
-    grouped = df.groupby("instrument_id")
-    adjustments = []
-    adjustment_dates = []
-    for spec in roll_spec:
-        d0 = pd.Timestamp(spec["d0"], tz=tz)
-        d1 = pd.Timestamp(spec["d1"], tz=tz)
-        s = int(spec["s"])
-        group = grouped.get_group(s)
-        piece = group[(group[date_col] >= d0) & (group[date_col] < d1)].copy()
-        if last_date is not None:
-            adjustment_piece = group[group[date_col] == last_date]
-            adjustment = last_true_value - adjustment_piece[adjust_by].iloc[-1]
-            adjustments.append(adjustment)
-            adjustment_dates.append(d0)
-        last_true_value = piece[adjust_by].iloc[-1]
-        last_date = piece[date_col].iloc[-1]
-    return pd.Series(adjustments, index=adjustment_dates, name="additive_adjustment")
+    tz: Optional[tzinfo],
+) -> list[tuple[pd.Timestamp, pd.Timestamp, int]]:
+    """Parse the dates and instrument of every roll segment in one pass."""
+    d0s = pd.DatetimeIndex([spec["d0"] for spec in roll_spec]).tz_localize(tz)
+    d1s = pd.DatetimeIndex([spec["d1"] for spec in roll_spec]).tz_localize(tz)
+    return list(zip(d0s, d1s, (int(spec["s"]) for spec in roll_spec)))
 
 
-def _calc_multiplicative_adjustment(
+def _splice_with_adjustment(
     roll_spec: list[dict[str, str]],
     df: pd.DataFrame,
     date_col: str,
     adjust_by: str,
-) -> pd.Series:
+    combine: Callable[[Any, Any], Any],
+) -> tuple[pd.DataFrame, pd.Series]:
+    """Splice the segments and find each roll's adjustment in a single pass.
+
+    The adjustment at a roll combines the last value of the previous segment
+    with the new instrument's value on that same date. It is returned aligned
+    to the spliced rows dated at the start of its segment, and missing
+    elsewhere.
+    """
     tz = df[date_col].dt.tz
+    dates = df[date_col].to_numpy(dtype="datetime64[ns]")
+    values = df[adjust_by].to_numpy()
+    order, block_ids, indptr = _index_instruments(df["instrument_id"].to_numpy(), dates)
+    sorted_dates = dates[order]
+    segments = _parse_segments(roll_spec, tz)
+    blocks = _find_blocks(block_ids, np.array([s for _, _, s in segments]))
+    one_tick = np.timedelta64(1, "ns")
     last_date = None
     last_true_value = None
-    grouped = df.groupby("instrument_id")
+    pieces = []
     adjustments = []
     adjustment_dates = []
-    for spec in roll_spec:
-        d0 = pd.Timestamp(spec["d0"], tz=tz)
-        d1 = pd.Timestamp(spec["d1"], tz=tz)
-        s = int(spec["s"])
-        group = grouped.get_group(s)
-        piece = group[(group[date_col] >= d0) & (group[date_col] < d1)].copy()
+    for (d0, d1, _), block in zip(segments, blocks):
+        rows = _slice_dates(
+            sorted_dates, indptr, block, d0.to_datetime64(), d1.to_datetime64()
+        )
+        # Restore frame order within the segment, as a boolean mask would.
+        piece = np.sort(order[rows])
         if last_date is not None:
-            adjustment_piece = group[group[date_col] == last_date]
-            adjustment = last_true_value / adjustment_piece[adjust_by].iloc[-1]
-            adjustments.append(adjustment)
+            same_date = _slice_dates(
+                sorted_dates, indptr, block, last_date, last_date + one_tick
+            )
+            # The lexsort is stable, so the last row on a date is last in `df`.
+            adjustment_row = order[same_date][-1]
+            adjustments.append(combine(last_true_value, values[adjustment_row]))
             adjustment_dates.append(d0)
-        last_true_value = piece[adjust_by].iloc[-1]
-        last_date = piece[date_col].iloc[-1]
-    return pd.Series(
-        adjustments,
-        index=adjustment_dates,
-        name="multiplicative_adjustment",
-    )
+        last_true_value = values[piece[-1]]
+        last_date = dates[piece[-1]]
+        pieces.append(piece)
+    spliced = df.take(np.concatenate(pieces)).reset_index(drop=True)
+    adjustment = spliced[date_col].map(pd.Series(adjustments, index=adjustment_dates))
+    return spliced, adjustment
 
 
 def additive_splice(
@@ -111,28 +97,22 @@ def additive_splice(
     """
     if adjustment_cols is None:
         adjustment_cols = [adjust_by]
-    spliced = _splice_unadjusted(roll_spec, df, date_col)
-    adjustments = _calc_additive_adjustment(
+    spliced, adjustment = _splice_with_adjustment(
         roll_spec,
         df,
         date_col=date_col,
         adjust_by=adjust_by,
+        combine=operator.sub,
     )
-    with_adjustment = spliced.merge(
-        adjustments,
-        left_on=date_col,
-        right_index=True,
-        how="left",
+    cumulative_adjustment = adjustment.to_numpy(
+        dtype=np.float64, na_value=np.nan, copy=True
     )
-    with_adjustment = with_adjustment.set_index(date_col)
-    aligned_adjustment = with_adjustment[adjustments.name]
-    aligned_adjustment = aligned_adjustment.fillna(value=0)
-    cumulative_adjustment = aligned_adjustment.cumsum()
+    cumulative_adjustment[np.isnan(cumulative_adjustment)] = 0
+    np.cumsum(cumulative_adjustment, out=cumulative_adjustment)
     for col in adjustment_cols:
-        with_adjustment[col] = with_adjustment[col] + cumulative_adjustment
-    with_adjustment[adjustments.name] = cumulative_adjustment  # type: ignore
-    new_columns = df.columns.tolist() + [adjustments.name]
-    return with_adjustment.reset_index()[new_columns]
+        spliced[col] = spliced[col] + cumulative_adjustment
+    spliced["additive_adjustment"] = cumulative_adjustment
+    return spliced[df.columns.tolist() + ["additive_adjustment"]]
 
 
 def multiplicative_splice(
@@ -163,25 +143,19 @@ def multiplicative_splice(
     """
     if adjustment_cols is None:
         adjustment_cols = [adjust_by]
-    spliced = _splice_unadjusted(roll_spec, df, date_col)
-    adjustments = _calc_multiplicative_adjustment(
+    spliced, adjustment = _splice_with_adjustment(
         roll_spec,
         df,
         date_col=date_col,
         adjust_by=adjust_by,
+        combine=operator.truediv,
     )
-    with_adjustment = spliced.merge(
-        adjustments,
-        left_on=date_col,
-        right_index=True,
-        how="left",
+    cumulative_adjustment = adjustment.to_numpy(
+        dtype=np.float64, na_value=np.nan, copy=True
     )
-    with_adjustment = with_adjustment.set_index(date_col)
-    aligned_adjustment = with_adjustment[adjustments.name]
-    aligned_adjustment = aligned_adjustment.fillna(value=1)
-    cumulative_adjustment = aligned_adjustment.cumprod()
+    cumulative_adjustment[np.isnan(cumulative_adjustment)] = 1
+    np.cumprod(cumulative_adjustment, out=cumulative_adjustment)
     for col in adjustment_cols:
-        with_adjustment[col] = with_adjustment[col] * cumulative_adjustment
-    with_adjustment[adjustments.name] = cumulative_adjustment  # type: ignore
-    new_columns = df.columns.tolist() + [adjustments.name]
-    return with_adjustment.reset_index()[new_columns]
+        spliced[col] = spliced[col] * cumulative_adjustment
+    spliced["multiplicative_adjustment"] = cumulative_adjustment
+    return spliced[df.columns.tolist() + ["multiplicative_adjustment"]]
@@ -31,8 +31,10 @@ but it is not required.
 import datetime
 import sys
 from io import StringIO
+from typing import Optional
 
 import databento as db
+import numpy as np
 import pandas as pd
 import pytest
 
@@ -40,6 +42,8 @@ from finm37000 import (
     constant_maturity_splice,
     get_databento_api_key,
     get_roll_spec,
+    get_roll_spec_records,
+    roll_spec_dtype,
     temp_env,
     us_business_day,
 )
@@ -118,6 +122,119 @@ def test_get_roll_spec() -> None:
     for i, spec in enumerate(actual):
         assert spec == expected[i], f"Spec {i} mismatch: {spec} != {expected[i]}"
 
+    records = get_roll_spec_records(
+        "SR3.cm.273", instrument_df, start=first_date.date(), end=end_march
+    )
+    assert records.dtype == roll_spec_dtype
+    assert records["p"].tolist() == [int(spec["p"]) for spec in expected]
+    assert records["n"].tolist() == [int(spec["n"]) for spec in expected]
+    assert records["d0"][0] == np.datetime64("2025-01-01")
+    assert records["d1"][-1] == np.datetime64("2025-03-31")
+
+
+def test_get_roll_spec_same_day_expirations() -> None:
+    """Contracts expiring on the same day are ordered by expiration time.
+
+    The ids are deliberately in the opposite order to the expiration times,
+    and one contract is re-sent with a later expiration time on the same day.
+    """
+    csv_data = """instrument_id,raw_symbol,expiration,instrument_class,ts_recv
+    1,SR3K5,2025-05-15 21:00:00+00:00,F,2025-01-01
+    7,SR3M5,2025-06-01 08:00:00+00:00,F,2025-01-01
+    3,SR3N5,2025-06-01 20:00:00+00:00,F,2025-01-01
+    9,SR3Q5,2025-06-01 09:00:00+00:00,F,2025-01-01
+    9,SR3Q5,2025-06-01 21:00:00+00:00,F,2025-01-02
+    4,SR3U5,2025-07-01 20:00:00+00:00,F,2025-01-01
+    """
+    instrument_df = pd.read_csv(
+        StringIO(csv_data), parse_dates=["expiration", "ts_recv"]
+    ).assign(ts_recv=lambda df: df["ts_recv"].dt.tz_localize("UTC"))
+
+    actual = get_roll_spec(
+        "SR3.cm.30",
+        instrument_df,
+        start=datetime.date(2025, 5, 1),
+        end=datetime.date(2025, 5, 2),
+    )
+    assert actual == [{"d0": "2025-05-01", "d1": "2025-05-02", "p": "1", "n": "7"}]
+
+    actual = get_roll_spec(
+        "SR3.cm.31",
+        instrument_df,
+        start=datetime.date(2025, 5, 2),
+        end=datetime.date(2025, 5, 3),
+    )
+    assert actual == [{"d0": "2025-05-02", "d1": "2025-05-03", "p": "9", "n": "4"}]
+
+
+@pytest.mark.parametrize(
+    ("tz", "expected"),
+    [
+        ("UTC", [{"d0": "2025-05-01", "d1": "2025-05-03", "p": "1", "n": "2"}]),
+        (
+            "America/Chicago",
+            [
+                {"d0": "2025-05-01", "d1": "2025-05-02", "p": "1", "n": "2"},
+                {"d0": "2025-05-02", "d1": "2025-05-03", "p": "2", "n": "3"},
+            ],
+        ),
+        (
+            None,
+            [
+                {"d0": "2025-05-01", "d1": "2025-05-02", "p": "1", "n": "2"},
+                {"d0": "2025-05-02", "d1": "2025-05-03", "p": "2", "n": "3"},
+            ],
+        ),
+    ],
+)
+def test_get_roll_spec_local_dates(
+    tz: Optional[str], expected: list[dict[str, str]]
+) -> None:
+    """Expirations are compared by their calendar date in their own zone.
+
+    SR3M5 expires on 2025-06-01 in UTC but on 2025-05-31 in Chicago. Naive
+    definitions hold Chicago wall times and are taken as they are.
+    """
+    csv_data = """instrument_id,raw_symbol,expiration,instrument_class,ts_recv
+    1,SR3K5,2025-05-15 12:00:00+00:00,F,2025-01-01 12:00:00+00:00
+    2,SR3M5,2025-06-01 02:00:00+00:00,F,2025-01-01 12:00:00+00:00
+    3,SR3N5,2025-07-01 12:00:00+00:00,F,2025-01-01 12:00:00+00:00
+    """
+    instrument_df = pd.read_csv(
+        StringIO(csv_data), parse_dates=["expiration", "ts_recv"]
+    )
+    for col in ["expiration", "ts_recv"]:
+        local = instrument_df[col].dt.tz_convert(tz or "America/Chicago")
+        instrument_df[col] = local if tz else local.dt.tz_localize(None)
+
+    actual = get_roll_spec(
+        "SR3.cm.30",
+        instrument_df,
+        start=datetime.date(2025, 5, 1),
+        end=datetime.date(2025, 5, 3),
+    )
+    assert actual == expected
+
+
+def test_get_roll_spec_missing_expiration() -> None:
+    """A future without an expiration is never picked as a roll contract."""
+    instrument_df = pd.DataFrame(
+        {
+            "instrument_id": [1, 2, 3],
+            "raw_symbol": ["SR3F5", "SR3G5", "SR3H5"],
+            "expiration": pd.to_datetime(["2025-01-10", "2025-02-10", "NaT"], utc=True),
+            "instrument_class": "F",
+            "ts_recv": pd.Timestamp("2024-12-01", tz="UTC"),
+        }
+    )
+    with pytest.raises(ValueError, match="No futures with maturity >="):
+        get_roll_spec(
+            "SR3.cm.60",
+            instrument_df,
+            start=datetime.date(2025, 1, 1),
+            end=datetime.date(2025, 1, 5),
+        )
+
 
 def test_constant_maturity_splice() -> None:
     symbol = "SR3.cm.182"
@@ -207,6 +324,113 @@ def test_constant_maturity_splice() -> None:
     )
     pd.testing.assert_frame_equal(actual, expected)
 
+    records = np.array(
+        [(r["d0"], r["d1"], int(r["p"]), int(r["n"])) for r in roll_spec],
+        dtype=roll_spec_dtype,
+    )
+    actual = constant_maturity_splice(
+        symbol,
+        records,
+        all_data,
+        date_col="datetime",
+        price_col="price",
+    )
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def test_constant_maturity_splice_missing_dates() -> None:
+    """Dates missing for one leg are kept with NaN like an outer join."""
+    t = pd.date_range("2025-01-01", periods=4, tz="UTC")
+    all_data = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "instrument_id": 1,
+                    "datetime": t[[0, 1, 3]],
+                    "price": [1, 2, 3],
+                    "expiration": pd.Timestamp("2025-06-01", tz="UTC"),
+                }
+            ),
+            pd.DataFrame(
+                {
+                    "instrument_id": 2,
+                    "datetime": t[[0, 2, 3]],
+                    "price": [5, 6, 7],
+                    "expiration": pd.Timestamp("2025-09-01", tz="UTC"),
+                }
+            ),
+        ]
+    )
+    roll_spec = [{"d0": "2025-01-01", "d1": "2025-01-05", "p": "1", "n": "2"}]
+    actual = constant_maturity_splice(
+        "X.cm.182",
+        roll_spec,
+        all_data,
+        date_col="datetime",
+        price_col="price",
+    )
+    pd.testing.assert_series_equal(actual["datetime"], pd.Series(t, name="datetime"))
+    pd.testing.assert_series_equal(
+        actual["pre_price"], pd.Series([1.0, 2.0, None, 3.0], name="pre_price")
+    )
+    pd.testing.assert_series_equal(
+        actual["next_price"], pd.Series([5.0, None, 6.0, 7.0], name="next_price")
+    )
+    assert actual["X.cm.182"].isna().tolist() == [False, True, True, False]
+
+    nullable = constant_maturity_splice(
+        "X.cm.182",
+        roll_spec,
+        all_data.astype({"price": "Int64"}),
+        date_col="datetime",
+        price_col="price",
+    )
+    assert nullable["X.cm.182"].dtype == "Float64"
+    assert nullable["X.cm.182"].isna().tolist() == [False, True, True, False]
+    pd.testing.assert_series_equal(
+        nullable["X.cm.182"].astype("float64"), actual["X.cm.182"]
+    )
+
+
+def test_constant_maturity_splice_dst_dates() -> None:
+    """Roll dates are local midnights in the zone of the date column.
+
+    The roll on 2025-03-10 falls just after the switch to daylight saving
+    time in Chicago, so a fixed offset would misplace the boundary.
+    """
+    t = pd.date_range("2025-03-08", "2025-03-11", tz="America/Chicago")
+    all_data = pd.concat(
+        [
+            pd.DataFrame(
+                {
+                    "instrument_id": instrument_id,
+                    "datetime": t,
+                    "price": float(instrument_id),
+                    "expiration": pd.Timestamp(expiration, tz="UTC"),
+                }
+            )
+            for instrument_id, expiration in [
+                (1, "2025-06-01"),
+                (2, "2025-07-01"),
+                (3, "2025-08-01"),
+            ]
+        ]
+    )
+    roll_spec = [
+        {"d0": "2025-03-08", "d1": "2025-03-10", "p": "1", "n": "2"},
+        {"d0": "2025-03-10", "d1": "2025-03-12", "p": "2", "n": "3"},
+    ]
+    actual = constant_maturity_splice(
+        "SR3.cm.91",
+        roll_spec,
+        all_data,
+        date_col="datetime",
+        price_col="price",
+    )
+    pd.testing.assert_series_equal(actual["datetime"], pd.Series(t, name="datetime"))
+    assert actual["pre_id"].tolist() == [1, 1, 2, 2]
+    assert actual["next_id"].tolist() == [2, 2, 3, 3]
+
 
 @pytest.mark.skip(reason="Integration testing against real data client.")
 def test_real_data() -> None:
@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from io import StringIO
 
 import numpy as np
@@ -300,3 +301,33 @@ def test_simple_multiplicative_splice_example() -> None:
         date_col="datetime",
     )
     pd.testing.assert_frame_equal(actual, expected)
+
+
+@pytest.mark.parametrize(
+    ("splice", "adjustment", "no_adjustment"),
+    [
+        (additive_splice, "additive_adjustment", 0.0),
+        (multiplicative_splice, "multiplicative_adjustment", 1.0),
+    ],
+)
+def test_single_segment_splice_dtypes(
+    splice: Callable[..., pd.DataFrame], adjustment: str, no_adjustment: float
+) -> None:
+    """A splice without rolls still returns float adjusted columns."""
+    df = pd.DataFrame(
+        {
+            "instrument_id": 1,
+            "datetime": pd.date_range("2025-01-01", periods=4),
+            "close": [1.0, 2.0, 3.0, 4.0],
+            "open": [1, 2, 3, 4],
+        }
+    )
+    roll_spec = [{"d0": "2025-01-01", "d1": "2025-01-04", "s": "1"}]
+    actual = splice(
+        roll_spec, df, date_col="datetime", adjustment_cols=["close", "open"]
+    )
+    assert actual[adjustment].dtype == np.float64
+    assert actual["close"].dtype == np.float64
+    assert actual["open"].dtype == np.float64
+    assert actual[adjustment].tolist() == [no_adjustment] * 3
+    assert actual["open"].tolist() == [1.0, 2.0, 3.0]